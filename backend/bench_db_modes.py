@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sync and async (asyncpg) database paths of main.py under the
+load_driver.py endpoint mix.
+
+Start the API once per mode and point this script at it:
+
+  DB_ASYNC=false uvicorn main:app --port 8000 --workers 1
+  python bench_db_modes.py --label sync --duration 60 --out bench_sync.json
+
+  DB_ASYNC=true uvicorn main:app --port 8000 --workers 1
+  python bench_db_modes.py --label async --duration 60 --out bench_async.json
+
+  python bench_db_modes.py --compare bench_sync.json bench_async.json
+
+Requests are fired open-loop at the load_driver BASE_RATE, so a blocked event
+loop shows up as queueing in the latency percentiles rather than as a lower
+request rate. Use --clear-cache-interval to force cache misses so the database
+path is actually exercised.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+from load_driver import ENDPOINTS, SERVER, PORT, BASE_RATE, BASE_CONNS
+
+# Extra listing variants so /sneakers misses are spread over several keys
+SNEAKER_QUERIES = [
+    "/sneakers?page=1&per_page=20",
+    "/sneakers?page=2&per_page=20",
+    "/sneakers?page=1&per_page=20&brand=Nike",
+    "/sneakers?page=1&per_page=20&featured_only=true",
+    "/sneakers?page=1&per_page=50&min_price=100&max_price=200",
+]
+
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(latencies, errors, elapsed):
+    count = len(latencies)
+    return {
+        "requests": count + errors,
+        "errors": errors,
+        "rps": round(count / elapsed, 1) if elapsed else 0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies) if latencies else None,
+    }
+
+def pick_uri():
+    endpoint = random.choice(ENDPOINTS)
+    if endpoint == "/sneakers":
+        return endpoint, random.choice(SNEAKER_QUERIES)
+    return endpoint, endpoint
+
+async def run(args):
+    base_url = f"http://{args.server}:{args.port}"
+    limits = httpx.Limits(max_connections=args.conns, max_keepalive_connections=args.conns)
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    semaphore = asyncio.Semaphore(args.conns)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+
+        async def one_request():
+            endpoint, uri = pick_uri()
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(uri)
+                    if response.status_code >= 500:
+                        errors[endpoint] += 1
+                        return
+                except httpx.HTTPError:
+                    errors[endpoint] += 1
+                    return
+                latencies[endpoint].append(round((time.perf_counter() - started) * 1000, 2))
+
+        async def clear_cache_loop():
+            while True:
+                await asyncio.sleep(args.clear_cache_interval)
+                try:
+                    await client.post("/cache/clear")
+                except httpx.HTTPError as e:
+                    print(f"⚠️ Cache clear failed: {e}")
+
+        clearer = None
+        if args.clear_cache_interval > 0:
+            clearer = asyncio.create_task(clear_cache_loop())
+
+        print(f"🚀 {args.label}: {args.rate} req/s for {args.duration}s against {base_url}")
+        tasks = []
+        interval = 1.0 / args.rate
+        started = time.perf_counter()
+        next_at = started
+        while time.perf_counter() - started < args.duration:
+            tasks.append(asyncio.create_task(one_request()))
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+        if clearer:
+            clearer.cancel()
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    report = {
+        "label": args.label,
+        "rate": args.rate,
+        "conns": args.conns,
+        "duration_s": round(elapsed, 1),
+        "overall": summarize(all_latencies, sum(errors.values()), elapsed),
+        "endpoints": {
+            endpoint: summarize(latencies[endpoint], errors[endpoint], elapsed)
+            for endpoint in sorted(set(latencies) | set(errors))
+        },
+    }
+    return report
+
+def compare(paths):
+    reports = [json.load(open(path)) for path in paths]
+    header = f"{'endpoint':<16}" + "".join(f"{r['label'] + ' p50/p99 ms':>28}" for r in reports)
+    print(header)
+    endpoints = ["overall"] + sorted({e for r in reports for e in r["endpoints"]})
+    for endpoint in endpoints:
+        line = f"{endpoint:<16}"
+        for r in reports:
+            stats = r["overall"] if endpoint == "overall" else r["endpoints"].get(endpoint, {})
+            line += f"{str(stats.get('p50_ms')) + ' / ' + str(stats.get('p99_ms')):>28}"
+        print(line)
+    for r in reports:
+        print(f"📊 {r['label']}: {r['overall']['rps']} req/s, {r['overall']['errors']} errors")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", default=SERVER)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--rate", type=int, default=BASE_RATE)
+    parser.add_argument("--conns", type=int, default=BASE_CONNS)
+    parser.add_argument("--duration", type=int, default=60)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--clear-cache-interval", type=float, default=0.0)
+    parser.add_argument("--label", default="run")
+    parser.add_argument("--out")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compare", nargs="+")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    random.seed(args.seed)
+    report = asyncio.run(run(args))
+    print(json.dumps(report["overall"], indent=2))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.out}")
+
+if __name__ == "__main__":
+    main()
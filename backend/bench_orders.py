@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Load test POST /orders and report orders/sec and latency percentiles.
+
+Start the API, then fire orders open-loop at a fixed rate:
+
+  python bench_orders.py --rate 2000 --duration 30 --out bench_orders.json
+
+A user is created through POST /users unless --user-id is given, and the SKU
+pool is read from /sneakers and the variants endpoint so every order carries
+the price the shop currently shows. Compare batching settings by restarting
+the API with different ORDER_BATCH_WINDOW_MS / ORDER_BATCH_MAX / ORDER_WRITERS
+and passing each report to --compare.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import Counter
+
+import httpx
+
+from bench_db_modes import percentile, compare
+from load_driver import SERVER, PORT
+
+def effective_price(variant):
+    return variant["sale_price"] if variant["sale_price"] is not None else variant["price"]
+
+async def load_sku_pool(client, pages, min_stock):
+    pool = []
+    for page in range(1, pages + 1):
+        response = await client.get("/sneakers", params={"page": page, "per_page": 100, "include_total": "false"})
+        response.raise_for_status()
+        for sneaker in response.json()["sneakers"]:
+            variants = (await client.get(f"/sneakers/{sneaker['id']}/variants")).json().get("variants", [])
+            pool.extend(
+                {"sku": v["sku"], "unit_price": effective_price(v)}
+                for v in variants
+                if v["stock_available"] >= min_stock
+            )
+    return pool
+
+async def run(args):
+    base_url = f"http://{args.server}:{args.port}"
+    limits = httpx.Limits(max_connections=args.conns, max_keepalive_connections=args.conns)
+    latencies = []
+    statuses = Counter()
+    semaphore = asyncio.Semaphore(args.conns)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        user_id = args.user_id
+        if not user_id:
+            response = await client.post("/users", json={
+                "email": f"bench-{uuid.uuid4().hex[:12]}@example.com",
+                "name": "Order Bench"
+            })
+            response.raise_for_status()
+            user_id = response.json()["id"]
+
+        pool = await load_sku_pool(client, args.pages, args.min_stock)
+        if not pool:
+            raise SystemExit("❌ No SKUs with enough stock to order")
+        print(f"🧾 {len(pool)} SKUs in the pool, ordering as user {user_id}")
+
+        async def one_order():
+            items = [
+                {**sku, "quantity": 1}
+                for sku in random.sample(pool, k=min(len(pool), random.randint(1, args.max_items)))
+            ]
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/orders", json={"user_id": user_id, "items": items})
+                    statuses[response.status_code] += 1
+                except httpx.HTTPError:
+                    statuses["error"] += 1
+                    return
+                latencies.append(round((time.perf_counter() - started) * 1000, 2))
+
+        print(f"🚀 {args.label}: {args.rate} orders/s for {args.duration}s against {base_url}")
+        tasks = []
+        interval = 1.0 / args.rate
+        started = time.perf_counter()
+        next_at = started
+        while time.perf_counter() - started < args.duration:
+            tasks.append(asyncio.create_task(one_order()))
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+        server_stats = (await client.get("/debug/order-stats", params={"window": int(elapsed) + 1})).json()
+
+    created = statuses.get(201, 0)
+    errors = sum(count for status, count in statuses.items() if status == "error" or status >= 500)
+    overall = {
+        "requests": sum(statuses.values()),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "orders_per_second": round(created / elapsed, 1) if elapsed else 0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies) if latencies else None,
+    }
+    return {
+        "label": args.label,
+        "rate": args.rate,
+        "conns": args.conns,
+        "duration_s": round(elapsed, 1),
+        "overall": overall,
+        "statuses": {str(status): count for status, count in statuses.items()},
+        "server": server_stats,
+        "endpoints": {"/orders": overall},
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--server", default=SERVER)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--rate", type=int, default=1000)
+    parser.add_argument("--conns", type=int, default=200)
+    parser.add_argument("--duration", type=int, default=30)
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--user-id")
+    parser.add_argument("--pages", type=int, default=5, help="Listing pages to draw SKUs from")
+    parser.add_argument("--min-stock", type=int, default=20)
+    parser.add_argument("--max-items", type=int, default=3)
+    parser.add_argument("--label", default="orders")
+    parser.add_argument("--out")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compare", nargs="+")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    random.seed(args.seed)
+    report = asyncio.run(run(args))
+    print(json.dumps({**report["overall"], "statuses": report["statuses"],
+                      "avg_batch_size": report["server"].get("avg_batch_size")}, indent=2))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+In-process columnar catalog index.
+
+Holds the sellable catalog (products and their SKUs) as NumPy column arrays so
+/sneakers can filter, aggregate and paginate with vectorised masks instead of
+going to Postgres. main.py loads it at startup and keeps it current from
+updated_at deltas; Postgres keeps serving writes, searches and detail reads.
+
+Rows are plain dicts, so this module has no database or web dependencies:
+
+  products: product_id, name, brand, category, description, image_url, rating,
+            reviews_count, is_featured, created_at, updated_at
+  skus:     id, sku, product_id, price, sale_price, stock_available, size,
+            color_name, is_flash_sale, flash_sale_end, updated_at
+"""
+
+import bisect
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+EPOCH = datetime(1970, 1, 1)
+NO_FLASH_END = np.iinfo(np.int64).min
+
+def normalise(value: str) -> str:
+    """Same normalisation as the API filters: collapsed whitespace, casefolded"""
+    return " ".join(value.split()).casefold()
+
+def to_micros(value: Optional[datetime]) -> int:
+    """Naive datetime -> microseconds since the epoch (NO_FLASH_END for None)"""
+    if value is None:
+        return NO_FLASH_END
+    return (value.replace(tzinfo=None) - EPOCH) // timedelta(microseconds=1)
+
+def from_micros(value: int) -> Optional[datetime]:
+    if value == NO_FLASH_END:
+        return None
+    return EPOCH + timedelta(microseconds=int(value))
+
+class Vocabulary:
+    """Dense integer codes for a string column, looked up by normalised text"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        key = normalise(value)
+        if key not in self.codes:
+            self.codes[key] = len(self.values)
+            self.values.append(value)
+        return self.codes[key]
+
+    def lookup(self, value: str) -> Optional[int]:
+        return self.codes.get(normalise(value))
+
+class CatalogIndex:
+    """
+    Column store for the listing query.
+
+    SKU columns are kept in growable arrays indexed by a SKU slot; brand,
+    category and featured are denormalised onto the SKU columns (like the skus
+    table does) so every listing filter is a single vectorised comparison.
+    Products are also ranked by product_id so pages come out in the same order,
+    and with the same keyset cursor, as the Postgres listing.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        self.ready = False
+        self.high_water: Optional[datetime] = None
+
+        self._brands = Vocabulary()
+        self._categories = Vocabulary()
+        self._colors = Vocabulary()
+
+        # Product side, indexed by product slot
+        self._product_ids: List[str] = []
+        self._product_slots: Dict[str, int] = {}
+        self._product_info: List[dict] = []
+        self._product_rank = np.empty(0, dtype=np.int64)
+        # product_id order: slot and id by rank
+        self._ranked_slots = np.empty(0, dtype=np.int64)
+        self._ranked_ids: List[str] = []
+
+        # SKU side, indexed by SKU slot
+        self._sku_slots: Dict[str, int] = {}
+        self._sku_ids: List[str] = []
+        self._sku_codes: List[str] = []
+        self._n_skus = 0
+        self._allocate(self.INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int):
+        self._sku_product = np.zeros(capacity, dtype=np.int64)
+        self._sku_rank = np.zeros(capacity, dtype=np.int64)
+        self._price = np.zeros(capacity, dtype=np.float64)
+        self._sale_price = np.full(capacity, np.nan, dtype=np.float64)
+        self._stock = np.zeros(capacity, dtype=np.int32)
+        self._size = np.zeros(capacity, dtype=np.float64)
+        self._color = np.zeros(capacity, dtype=np.int32)
+        self._is_flash = np.zeros(capacity, dtype=bool)
+        self._flash_end = np.full(capacity, NO_FLASH_END, dtype=np.int64)
+        self._brand = np.zeros(capacity, dtype=np.int32)
+        self._category = np.zeros(capacity, dtype=np.int32)
+        self._featured = np.zeros(capacity, dtype=bool)
+
+    def _columns(self):
+        return (
+            "_sku_product", "_sku_rank", "_price", "_sale_price", "_stock", "_size", "_color",
+            "_is_flash", "_flash_end", "_brand", "_category", "_featured",
+        )
+
+    def _ensure_capacity(self, needed: int):
+        capacity = len(self._price)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in self._columns():
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            if name == "_sale_price":
+                new[len(old):] = np.nan
+            elif name == "_flash_end":
+                new[len(old):] = NO_FLASH_END
+            else:
+                new[len(old):] = 0
+            setattr(self, name, new)
+
+    @property
+    def sku_count(self) -> int:
+        return self._n_skus
+
+    @property
+    def product_count(self) -> int:
+        return len(self._product_ids)
+
+    # Loading
+    def load(self, products: Iterable[dict], skus: Iterable[dict]):
+        """Initial build from full product and SKU scans"""
+        self.apply_changes(products, skus)
+        self.ready = True
+
+    def apply_changes(self, products: Iterable[dict], skus: Iterable[dict]):
+        """
+        Upsert changed products and SKUs. Re-applying a row is harmless, so the
+        caller can use an overlapping updated_at window. Deleted rows are not
+        seen here; a periodic full reload drops them.
+        """
+        new_products = False
+        changed_products = []
+        for row in products:
+            slot, created = self._upsert_product(row)
+            new_products |= created
+            if not created:
+                changed_products.append(slot)
+            self._bump_high_water(row.get("updated_at"))
+
+        if new_products:
+            self._rebuild_order()
+        if changed_products:
+            self._sync_product_columns(np.array(changed_products, dtype=np.int64))
+
+        for row in skus:
+            self._upsert_sku(row)
+            self._bump_high_water(row.get("updated_at"))
+
+    def _bump_high_water(self, updated_at: Optional[datetime]):
+        if updated_at is not None and (self.high_water is None or updated_at > self.high_water):
+            self.high_water = updated_at
+
+    def _upsert_product(self, row: dict) -> Tuple[int, bool]:
+        product_id = str(row["product_id"])
+        info = {
+            "name": row["name"],
+            "brand": row["brand"],
+            "category": row["category"],
+            "description": row.get("description"),
+            "image_url": row.get("image_url") or "",
+            "rating": row.get("rating"),
+            "reviews_count": row.get("reviews_count"),
+            "is_featured": bool(row.get("is_featured")),
+            "created_at": row.get("created_at"),
+            "brand_code": self._brands.code(row["brand"]),
+            "category_code": self._categories.code(row["category"]),
+        }
+
+        slot = self._product_slots.get(product_id)
+        if slot is not None:
+            self._product_info[slot] = info
+            return slot, False
+
+        slot = len(self._product_ids)
+        self._product_slots[product_id] = slot
+        self._product_ids.append(product_id)
+        self._product_info.append(info)
+        return slot, True
+
+    def _rebuild_order(self):
+        """Rank products by product_id (same order as Postgres sorts UUIDs)"""
+        self._ranked_ids = sorted(self._product_ids)
+        self._ranked_slots = np.fromiter(
+            (self._product_slots[product_id] for product_id in self._ranked_ids),
+            dtype=np.int64,
+            count=len(self._ranked_ids),
+        )
+        self._product_rank = np.empty(len(self._ranked_ids), dtype=np.int64)
+        self._product_rank[self._ranked_slots] = np.arange(len(self._ranked_ids))
+        n = self._n_skus
+        self._sku_rank[:n] = self._product_rank[self._sku_product[:n]]
+
+    def _sync_product_columns(self, slots: np.ndarray):
+        """Copy changed product attributes onto their denormalised SKU columns"""
+        n = self._n_skus
+        rows = np.flatnonzero(np.isin(self._sku_product[:n], slots))
+        for row in rows.tolist():
+            info = self._product_info[self._sku_product[row]]
+            self._brand[row] = info["brand_code"]
+            self._category[row] = info["category_code"]
+            self._featured[row] = info["is_featured"]
+
+    def _upsert_sku(self, row: dict):
+        product_slot = self._product_slots.get(str(row["product_id"]))
+        if product_slot is None:
+            return  # Orphan SKU - its product is not loaded
+
+        sku_id = str(row["id"])
+        slot = self._sku_slots.get(sku_id)
+        if slot is None:
+            slot = self._n_skus
+            self._ensure_capacity(slot + 1)
+            self._sku_slots[sku_id] = slot
+            self._sku_ids.append(sku_id)
+            self._sku_codes.append(row["sku"])
+            self._n_skus += 1
+        else:
+            self._sku_codes[slot] = row["sku"]
+
+        info = self._product_info[product_slot]
+        sale_price = row.get("sale_price")
+        self._sku_product[slot] = product_slot
+        self._sku_rank[slot] = self._product_rank[product_slot]
+        self._price[slot] = row["price"]
+        self._sale_price[slot] = np.nan if sale_price is None else sale_price
+        self._stock[slot] = row["stock_available"]
+        self._size[slot] = row["size"]
+        self._color[slot] = self._colors.code(row["color_name"])
+        self._is_flash[slot] = bool(row.get("is_flash_sale"))
+        self._flash_end[slot] = to_micros(row.get("flash_sale_end"))
+        self._brand[slot] = info["brand_code"]
+        self._category[slot] = info["category_code"]
+        self._featured[slot] = info["is_featured"]
+
+    # Querying
+    def query(
+        self,
+        brand: Optional[str] = None,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        featured_only: Optional[bool] = False,
+        flash_sale_only: Optional[bool] = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+        with_total: bool = True,
+        now: Optional[datetime] = None,
+    ):
+        """
+        Same semantics as main.build_sneaker_cards_query: SKU level filters pick
+        the SKUs, products are the ones with at least one matching SKU, and the
+        card aggregates cover the matching SKUs only.
+
+        Returns (cards, total, next_product_id); total is None unless with_total.
+        """
+        n = self._n_skus
+        mask = self._stock[:n] > 0
+
+        if brand:
+            code = self._brands.lookup(brand)
+            if code is None:
+                return [], 0 if with_total else None, None
+            mask &= self._brand[:n] == code
+        if category:
+            code = self._categories.lookup(category)
+            if code is None:
+                return [], 0 if with_total else None, None
+            mask &= self._category[:n] == code
+        if featured_only:
+            mask &= self._featured[:n]
+        if min_price is not None:
+            mask &= self._price[:n] >= min_price
+        if max_price is not None:
+            mask &= self._price[:n] <= max_price
+        if flash_sale_only:
+            now_micros = to_micros(now or datetime.now())
+            mask &= self._is_flash[:n] & (self._flash_end[:n] > now_micros)
+
+        rows = np.flatnonzero(mask)
+        ranks = self._sku_rank[rows]
+        # Ranks of the matching products, already in product_id order
+        hit = np.zeros(len(self._ranked_ids), dtype=bool)
+        hit[ranks] = True
+        matched = np.flatnonzero(hit)
+
+        start = offset
+        if after is not None:
+            first_rank = bisect.bisect_right(self._ranked_ids, after)
+            start = int(np.searchsorted(matched, first_rank, side="left"))
+        stop = len(matched) if limit is None else start + limit
+        page = matched[start:stop]
+
+        cards = self._build_cards(rows, ranks, page)
+        has_more = stop < len(matched)
+        next_product_id = self._ranked_ids[page[-1]] if has_more and len(page) else None
+        total = len(matched) if with_total else None
+        return cards, total, next_product_id
+
+    def _build_cards(self, rows: np.ndarray, ranks: np.ndarray, page: np.ndarray) -> List[dict]:
+        if not len(page):
+            return []
+
+        in_page = np.zeros(len(self._ranked_ids), dtype=bool)
+        in_page[page] = True
+        in_page = in_page[ranks]
+        groups: Dict[int, List[int]] = {}
+        for row, rank in zip(rows[in_page].tolist(), ranks[in_page].tolist()):
+            groups.setdefault(rank, []).append(row)
+
+        return [
+            self._card(int(self._ranked_slots[rank]), groups[rank])
+            for rank in page.tolist()
+        ]
+
+    def _card(self, product_slot: int, sku_rows: List[int]) -> dict:
+        info = self._product_info[product_slot]
+        # Representative SKU is the cheapest one (ties broken by SKU id)
+        representative = min(sku_rows, key=lambda row: (self._price[row], self._sku_ids[row]))
+        sale_price = self._sale_price[representative]
+        colors = self._colors.values
+
+        return {
+            "id": self._product_ids[product_slot],
+            "sku": self._sku_codes[representative],
+            "name": info["name"],
+            "brand": info["brand"],
+            "price": float(self._price[representative]),
+            "sale_price": None if np.isnan(sale_price) else float(sale_price),
+            "description": info["description"],
+            "category": info["category"],
+            "sizes": sorted({float(self._size[row]) for row in sku_rows}),
+            "colors": sorted({colors[self._color[row]] for row in sku_rows}),
+            "image_url": info["image_url"],
+            "stock_quantity": int(sum(int(self._stock[row]) for row in sku_rows)),
+            "rating": info["rating"],
+            "reviews_count": info["reviews_count"],
+            "is_featured": info["is_featured"],
+            "is_flash_sale": bool(self._is_flash[representative]),
+            "flash_sale_end": from_micros(self._flash_end[representative]),
+            "created_at": info["created_at"],
+        }
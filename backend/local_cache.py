@@ -0,0 +1,86 @@
+"""
+In-process L1 cache in front of Redis.
+
+An LRU of already-decoded cache entries, bounded by an approximate byte budget
+and expiring every entry at its own deadline. main.py consults it before Redis
+for every CACHE_TTL prefix; entries are charged the length of their JSON
+payload, so the budget tracks what the same entries take in Redis.
+
+Invalidations are local only - main.py publishes them on a Redis channel so
+every worker drops its copy. `epoch` moves on every invalidation: a reader
+records it before going to Redis and passes it back to set(), which refuses
+the value if an invalidation happened in between, so a payload read just
+before a delete never lands in L1 after it.
+"""
+
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+MISSING = object()
+
+class LocalCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.epoch = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()  # key -> (value, size, expires_at)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """The cached value, or MISSING when absent or expired"""
+        entry = self.get_entry(key)
+        return entry if entry is MISSING else entry[0]
+
+    def get_entry(self, key: str) -> Any:
+        """(value, seconds left), or MISSING when absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        value, size, expires_at = entry
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            self._remove(key)
+            return MISSING
+        self._entries.move_to_end(key)
+        return value, remaining
+
+    def set(self, key: str, value: Any, size: int, ttl: float, epoch: Optional[int] = None):
+        """Store `value` for `ttl` seconds, evicting least recently used entries to fit"""
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if epoch is not None and epoch != self.epoch:
+            return  # Invalidated while the value was in flight
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, size, time.monotonic() + ttl)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def delete(self, keys: Iterable[str]):
+        self.epoch += 1
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+
+    def delete_matching(self, pattern: str):
+        """Drop every key matching a Redis style glob pattern"""
+        self.epoch += 1
+        for key in [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]:
+            self._remove(key)
+
+    def clear(self):
+        self.epoch += 1
+        self._entries.clear()
+        self.bytes = 0
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size